@@ -0,0 +1,54 @@
+import importlib
+from typing import Any, Optional
+
+# Marks a proxy whose target has not been imported yet (the target itself may be None)
+_NOT_LOADED = object()
+
+
+class LazyImport:
+    """
+    Proxy that defers importing a module (or one of its attributes) until first use.
+
+    Heavy dependencies such as pandas, requests and bs4 dominate the cold start of
+    short-lived processes (cron CLI, alert hooks). Wrapping them in a LazyImport keeps
+    `import data.generate_data` cheap and only pays the cost on the code path that
+    actually needs the dependency.
+    """
+
+    def __init__(self, module: str, attr: Optional[str] = None):
+        """
+        Initialize the proxy.
+
+        Args:
+            module: Fully qualified module name (e.g. "pandas")
+            attr: Optional attribute of the module to proxy (e.g. "logger" for loguru)
+        """
+        self._module = module
+        self._attr = attr
+        self._target = _NOT_LOADED
+
+    def _resolve(self) -> Any:
+        """
+        Import the module on first access and cache the resolved object.
+
+        Returns:
+            The imported module or the requested attribute
+        """
+        if self._target is _NOT_LOADED:
+            target = importlib.import_module(self._module)
+            if self._attr is not None:
+                target = getattr(target, self._attr)
+            self._target = target
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        name = self._module if self._attr is None else f"{self._module}.{self._attr}"
+        state = "not loaded" if self._target is _NOT_LOADED else "loaded"
+        return f"<LazyImport {name} ({state})>"
+
@@ -3,6 +3,8 @@ import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Any, Union
 
+from .timeindex import from_iso, to_datetime
+
 
 class WeatherAPI:
     """
@@ -167,8 +169,8 @@ class WeatherAPI:
         # Create DataFrame with time as index
         df = pd.DataFrame(data[data_type])
         
-        # Convert time column to datetime and set as index
-        df['time'] = pd.to_datetime(df['time'])
+        # Convert time column to datetime (via the shared hourly time index) and set as index
+        df['time'] = to_datetime(from_iso(df['time'].to_numpy()))
         df.set_index('time', inplace=True)
         
         return df
@@ -0,0 +1,137 @@
+"""
+Cold start benchmark for the data package.
+
+Each snippet runs in a fresh interpreter. A predict-only run still imports pandas,
+requests, loguru and tqdm, which dominate its ~550-600 ms cold start; deferring the
+clients only saves the bs4 import and the WebScraper construction, roughly 20-65 ms
+locally and close to run-to-run noise. The large savings are for processes that never
+reach the data stack: `import data.generate_data` (<1 ms) and the CLI's --help (~8 ms).
+"""
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Predict-only run with the Open-Meteo request stubbed out: one week of hourly data for
+# every metric, then the regular generate() path including _process_data
+PREDICT_RUN = (
+    "import warnings\n"
+    "warnings.simplefilter('ignore')\n"
+    "from data.api import WeatherAPI\n"
+    "from data.generate_data import DataGenerator\n"
+    "def fake_weather_data(self, start_date, end_date, hourly_metrics=None, **kwargs):\n"
+    "    times = [f'2024-01-{d:02d}T{h:02d}:00' for d in range(1, 8) for h in range(24)]\n"
+    "    hourly = {m: [float(i) for i in range(len(times))] for m in hourly_metrics}\n"
+    "    return {'hourly': {'time': times, **hourly}}\n"
+    "WeatherAPI.get_weather_data = fake_weather_data\n"
+    "generator = DataGenerator()\n"
+)
+PREDICT_CALL = "generator.generate('2024-01-01', '2024-01-07', type='predict', save=False)"
+
+# Snippets executed in a fresh interpreter for each run (cold start)
+SNIPPETS: Dict[str, str] = {
+    "import data.generate_data": "import data.generate_data",
+    "python -m data.cli --help": (
+        "import contextlib, io\n"
+        "from data.cli import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    try:\n"
+        "        main(['--help'])\n"
+        "    except SystemExit:\n"
+        "        pass"
+    ),
+    "predict run (lazy clients)": PREDICT_RUN + PREDICT_CALL,
+    # Same lazy code, additionally importing bs4 and constructing the WebScraper. This
+    # is not the old eager __init__ (which also built WeatherAPI up front and created
+    # the output directory), only the part a predict-only run no longer pays for
+    "predict run + WebScraper constructed up front": (
+        PREDICT_RUN + "generator.scraper\n" + PREDICT_CALL
+    ),
+}
+
+HEAVY_MODULES = ["pandas", "requests", "bs4", "loguru", "tqdm"]
+
+
+def time_snippet(code: str, repeat: int = 5) -> List[float]:
+    """
+    Measure the wall time of running a snippet in a fresh interpreter.
+
+    Args:
+        code: Python source to execute
+        repeat: Number of cold runs
+
+    Returns:
+        List of durations in milliseconds
+    """
+    root = Path(__file__).resolve().parent.parent
+    timer = (
+        "import time\n"
+        "t0 = time.perf_counter()\n"
+        f"exec({code!r})\n"
+        "print((time.perf_counter() - t0) * 1000)"
+    )
+    timings = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", timer],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def loaded_heavy_modules(code: str) -> List[str]:
+    """
+    List which heavy dependencies end up in sys.modules after running a snippet.
+
+    Args:
+        code: Python source to execute
+
+    Returns:
+        Names of heavy modules that were imported
+    """
+    root = Path(__file__).resolve().parent.parent
+    probe = (
+        "import sys\n"
+        f"exec({code!r})\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    loaded = out.stdout.strip().splitlines()[-1] if out.stdout.strip() else ""
+    return [m for m in loaded.split(",") if m]
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    # Runs are interleaved (one run of every snippet per round) so that machine noise
+    # and drift affect all snippets alike, and the predict runs can be compared per round
+    timings: Dict[str, List[float]] = {label: [] for label in SNIPPETS}
+    for _ in range(repeat):
+        for label, code in SNIPPETS.items():
+            timings[label] += time_snippet(code, 1)
+
+    print(f"Cold start timings over {repeat} interleaved runs (median / min, ms)")
+    for label, code in SNIPPETS.items():
+        heavy = loaded_heavy_modules(code)
+        print(
+            f"{label:<55} {statistics.median(timings[label]):8.1f} / {min(timings[label]):8.1f}"
+            f"   loaded: {', '.join(heavy) or '-'}"
+        )
+
+    lazy = timings["predict run (lazy clients)"]
+    eager = timings["predict run + WebScraper constructed up front"]
+    saved = [e - l for e, l in zip(eager, lazy)]
+    print(
+        f"Predict run saving (bs4 + WebScraper), median of per-round differences: "
+        f"{statistics.median(saved):.1f} ms"
+    )
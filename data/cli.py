@@ -0,0 +1,60 @@
+import argparse
+from typing import List, Optional
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the dataset generation CLI.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m data.cli",
+        description="Generate train or predict datasets from weather and water level data."
+    )
+    parser.add_argument("start_date", help="Start date in format YYYY-MM-DD")
+    parser.add_argument("end_date", help="End date in format YYYY-MM-DD")
+    parser.add_argument(
+        "--type",
+        choices=["train", "predict"],
+        default="train",
+        help="Dataset type (default: train)"
+    )
+    parser.add_argument("--output-dir", default=None, help="Directory to save generated datasets")
+    parser.add_argument("--filename", default=None, help="Custom output filename")
+    parser.add_argument("--no-save", action="store_true", help="Do not write the dataset to disk")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for the dataset generation CLI.
+
+    The heavy data stack is only imported after the arguments are parsed, so `--help`
+    and argument errors return immediately.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+
+    from .generate_data import generate
+
+    df = generate(
+        start_date=args.start_date,
+        end_date=args.end_date,
+        type=args.type,
+        output_dir=args.output_dir,
+        save=not args.no_save,
+        filename=args.filename
+    )
+    print(f"{args.type.capitalize()} data shape: {df.shape}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,11 +1,21 @@
-import pandas as pd
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Literal, Optional
-from loguru import logger
-from tqdm.auto import tqdm
+from typing import TYPE_CHECKING, Literal, Optional
+
+from ._lazy import LazyImport
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    from .api import WeatherAPI
+    from .scraping import WebScraper
+    from .validation import DataValidator
+else:
+    pd = LazyImport("pandas")
 
-from .api import WeatherAPI
-from .scraping import WebScraper
+logger = LazyImport("loguru", "logger")
+tqdm = LazyImport("tqdm.auto", "tqdm")
 
 class DataGenerator:
     """
@@ -13,24 +23,64 @@ class DataGenerator:
     Combines weather data from API and water level data from web scraping.
     """
     
-    def __init__(self, output_dir: Optional[str] = None):
+    def __init__(self, output_dir: Optional[str] = None, validator: Optional[DataValidator] = None):
         """
         Initialize the DataGenerator.
         
         Args:
             output_dir: Directory to save generated datasets (default: data/output)
+            validator: DataValidator used to check scraped water levels
+                       (default: DataValidator with default thresholds)
         """
-        self.weather_api = WeatherAPI()
-        self.scraper = WebScraper()
+        # Clients are built on first use so predict-only runs never construct the scraper
+        self._weather_api = None
+        self._scraper = None
+        self._validator = validator
+        self.quality_report = None
         
         if output_dir is None:
             self.output_dir = Path(__file__).parent / "output"
         else:
             self.output_dir = Path(output_dir)
         
-        self.output_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"DataGenerator initialized with output directory: {self.output_dir}")
     
+    @property
+    def weather_api(self) -> WeatherAPI:
+        """WeatherAPI client, created on first access."""
+        if self._weather_api is None:
+            from .api import WeatherAPI
+            self._weather_api = WeatherAPI()
+        return self._weather_api
+    
+    @weather_api.setter
+    def weather_api(self, value: WeatherAPI) -> None:
+        self._weather_api = value
+    
+    @property
+    def scraper(self) -> WebScraper:
+        """WebScraper client, created on first access (only needed for train datasets)."""
+        if self._scraper is None:
+            from .scraping import WebScraper
+            self._scraper = WebScraper()
+        return self._scraper
+    
+    @scraper.setter
+    def scraper(self, value: WebScraper) -> None:
+        self._scraper = value
+    
+    @property
+    def validator(self) -> DataValidator:
+        """DataValidator for scraped water levels, created on first access."""
+        if self._validator is None:
+            from .validation import DataValidator
+            self._validator = DataValidator()
+        return self._validator
+    
+    @validator.setter
+    def validator(self, value: DataValidator) -> None:
+        self._validator = value
+    
     def _get_weather_data(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Fetch weather data from the API.
@@ -72,13 +122,39 @@ class DataGenerator:
             logger.error(f"Error scraping water level data: {str(e)}")
             raise
     
-    def _merge_datasets(self, weather_df: pd.DataFrame, level_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    def _validate_water_level_data(self, level_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the data-quality checks on scraped water level data.
+        
+        Duplicated timestamps are dropped and invalid readings (unparsable, out of
+        range, spikes, stuck sensor) are set to NaN so they are interpolated later.
+        The report is kept in self.quality_report.
+        
+        Args:
+            level_df: DataFrame with water level data
+            
+        Returns:
+            Cleaned DataFrame with water level data
+        """
+        mask, report = self.validator.validate(level_df)
+        self.validator.log_report(report)
+        self.quality_report = report
+        return self.validator.clean(level_df, mask=mask)
+    
+    def _merge_datasets(
+        self,
+        weather_df: pd.DataFrame,
+        level_df: Optional[pd.DataFrame] = None,
+        hour_offsets: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
         """
         Merge weather and water level data by timestamp.
         
         Args:
             weather_df: DataFrame with weather data
             level_df: DataFrame with water level data (optional)
+            hour_offsets: Hour offsets of the weather rows (derived from the index
+                          if not provided)
             
         Returns:
             Merged DataFrame
@@ -87,48 +163,64 @@ class DataGenerator:
         if level_df is None:
             return weather_df
         
+        from .timeindex import MINUTES_PER_HOUR, align, to_hours, to_minutes
+        
         # Ensure index is datetime for both datasets
         if not isinstance(weather_df.index, pd.DatetimeIndex):
             weather_df.set_index('time', inplace=True)
         
-        # Rename column for clarity
-        level_df = level_df.rename(columns={"Nível": "water_level"})
+        if hour_offsets is None:
+            hour_offsets = to_hours(weather_df.index.to_numpy())
         
-        # Resample and merge datasets (joining on datetime index)
-        # Use outer join and then fill missing values
-        merged_df = pd.merge_asof(
-            weather_df.reset_index(),
-            level_df.rename(columns={"Data": "time"}).sort_values("time"),
-            on="time",
-            direction="nearest",
-            tolerance=pd.Timedelta("1h")
+        # Join on the integer offsets: each weather hour takes the nearest water level
+        # reading within 1h (same rule as merge_asof "nearest"); readings blanked by the
+        # validator stay NaN and are interpolated in _process_data
+        merged_df = weather_df.reset_index()
+        merged_df["water_level"] = align(
+            hour_offsets * MINUTES_PER_HOUR,
+            to_minutes(level_df["Data"].to_numpy()),
+            level_df["Nível"].to_numpy(dtype=float),
+            tolerance=MINUTES_PER_HOUR
         )
         
         logger.info(f"Datasets merged successfully: {merged_df.shape} rows")
         return merged_df
     
-    def _process_data(self, df: pd.DataFrame, type: Literal["train", "predict"]) -> pd.DataFrame:
+    def _process_data(
+        self,
+        df: pd.DataFrame,
+        type: Literal["train", "predict"],
+        hour_offsets: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
         """
         Process the dataset for training or prediction.
         
         Args:
             df: DataFrame with merged data
             type: Whether processing for "train" or "predict"
+            hour_offsets: Hour offsets of the rows of df (derived from the time column
+                          if not provided)
             
         Returns:
             Processed DataFrame
         """
+        from .timeindex import calendar_features, to_hours
+        
         # Create a copy to avoid fragmentation
         df = df.copy()
         
+        if hour_offsets is None:
+            hour_offsets = to_hours(df['time'].to_numpy())
+        
         # Convert object types and handle missing values
         numeric_columns = df.select_dtypes(include=['float64', 'int64']).columns
         df[numeric_columns] = df[numeric_columns].interpolate(method='linear')
 
-        # Add basic time features
-        df['hour'] = df['time'].dt.hour
-        df['day_of_week'] = df['time'].dt.dayofweek
-        df['month'] = df['time'].dt.month
+        # Add basic time features from the cached calendar table
+        calendar = calendar_features(hour_offsets)
+        df['hour'] = calendar['hour']
+        df['day_of_week'] = calendar['day_of_week']
+        df['month'] = calendar['month']
 
         # Prepare features for rolling calculations
         features = [col for col in df.columns if col not in ['time', 'water_level']]
@@ -200,22 +292,30 @@ class DataGenerator:
         # Get weather data from API
         weather_df = self._get_weather_data(start_date, end_date)
         
+        # Integer hour offsets of the weather rows (a cast of the datetime index), shared
+        # by the merge and the calendar features
+        from .timeindex import to_hours
+        hour_offsets = to_hours(weather_df.index.to_numpy())
+        
         # For training data, also get water level from scraping
         if type == "train":
             level_df = self._get_water_level_data(start_date, end_date)
-            merged_df = self._merge_datasets(weather_df, level_df)
+            level_df = self._validate_water_level_data(level_df)
+            merged_df = self._merge_datasets(weather_df, level_df, hour_offsets)
         else:
             # For prediction, only use weather data
             merged_df = weather_df.reset_index()
             
         # Process data based on type
-        final_df = self._process_data(merged_df, type)
+        final_df = self._process_data(merged_df, type, hour_offsets)
         
         # Save to file if requested
         if save:
             if filename is None:
                 filename = f"{type}_data_{start_date}_{end_date}.csv"
             
+            # Output directory is only created when something is actually written
+            self.output_dir.mkdir(parents=True, exist_ok=True)
             file_path = self.output_dir / filename
             final_df.to_csv(file_path, index=False)
             logger.info(f"Dataset saved to {file_path}")
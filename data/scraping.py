@@ -1,10 +1,13 @@
 import requests
 from bs4 import BeautifulSoup
+import numpy as np
 import pandas as pd
 from loguru import logger
 from pathlib import Path
 from tqdm.auto import tqdm
 
+from .timeindex import NAT, minutes_to_datetime, parse_scraped, to_minutes
+
 class WebScraper:
     """Classe responsável por realizar o Web Scraping."""
     def __init__(self):
@@ -71,12 +74,25 @@ class WebScraper:
             return pd.DataFrame(columns=["Data", "Nível"])
             
         df = pd.concat(tables, ignore_index=True)
-        # Convert Data column to datetime
-        df['Data'] = pd.to_datetime(df['Data'], format='%d/%m/%Y %H:%M')
+        # Converte a coluna Data para minutos inteiros desde a época (índice de tempo compartilhado)
+        datas = df['Data'].to_numpy()
+        minutes = parse_scraped(datas)
+        # O caminho rápido só aceita datas com zeros à esquerda; as demais (ex. "1/1/2024 1:00")
+        # são reinterpretadas pelo pandas antes de serem descartadas
+        fallback = minutes == NAT
+        if fallback.any():
+            reparsed = pd.to_datetime(pd.Series(datas[fallback]), format='%d/%m/%Y %H:%M', errors='coerce')
+            minutes[fallback] = to_minutes(reparsed.to_numpy())
+        invalid = minutes == NAT
+        if invalid.any():
+            logger.warning(f"{int(invalid.sum())} linhas com data inválida descartadas")
         # Convert Nível column to float
         df['Nível'] = pd.to_numeric(df['Nível'], errors='coerce')
-        # Sort by date
-        df = df.sort_values('Data', ascending=True).reset_index(drop=True)
+        # Ordena pelos minutos inteiros, sem reinterpretar as datas
+        order = np.flatnonzero(~invalid)
+        order = order[np.argsort(minutes[order], kind='mergesort')]
+        df = df.iloc[order].reset_index(drop=True)
+        df['Data'] = minutes_to_datetime(minutes[order])
         logger.info(f"Formato final do DataFrame: {df.shape}")
         return df
 
@@ -0,0 +1,278 @@
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
+# Timestamps are represented as integer offsets from 1970-01-01T00:00 (naive local time):
+# hour offsets for the hourly grid (the int64 view of numpy's datetime64[h]) and minute
+# offsets for readings that are not aligned to the hour (the int64 view of
+# datetime64[m]). Strings are parsed once, at the source; afterwards DataFrames keep plain
+# datetime64 columns and the offsets are recovered by a cast (to_hours / to_minutes).
+# Conversions to offsets always floor; snapping readings onto the hourly grid only
+# happens in align(). Missing timestamps use the same sentinel as numpy's NaT.
+NAT = np.iinfo(np.int64).min
+MINUTES_PER_HOUR = 60
+
+# Span of the cached calendar table (days since epoch); other days are computed on demand
+_CALENDAR_FIRST_DAY = int(np.datetime64("1900-01-01", "D").astype(np.int64))
+_CALENDAR_LAST_DAY = int(np.datetime64("2100-01-01", "D").astype(np.int64))
+
+# Layout of the dates in the Defesa Civil table: dd/mm/YYYY HH:MM
+_SCRAPED_WIDTH = 16
+_SCRAPED_SEPARATORS = {2: "/", 5: "/", 10: " ", 13: ":"}
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
+
+
+def to_hours(values: Iterable) -> np.ndarray:
+    """
+    Convert timestamps to integer hour offsets from the epoch.
+
+    Args:
+        values: datetime64 values (any unit) or integer hour offsets
+
+    Returns:
+        int64 array of hour offsets (timestamps are floored to the hour)
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int64, copy=False)
+    if values.dtype.kind != "M":
+        values = values.astype("datetime64[ns]")
+    return values.astype("datetime64[h]").astype(np.int64)
+
+
+def to_minutes(values: Iterable) -> np.ndarray:
+    """
+    Convert timestamps to integer minute offsets from the epoch.
+
+    Args:
+        values: datetime64 values (any unit) or integer minute offsets
+
+    Returns:
+        int64 array of minute offsets (timestamps are floored to the minute, NaT to NAT)
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        return values.astype(np.int64, copy=False)
+    if values.dtype.kind != "M":
+        values = values.astype("datetime64[ns]")
+    return values.astype("datetime64[m]").astype(np.int64)
+
+
+def to_datetime(hours: Iterable) -> np.ndarray:
+    """
+    Convert integer hour offsets back to timestamps, without any string parsing.
+
+    Args:
+        hours: Integer hour offsets from the epoch
+
+    Returns:
+        datetime64[ns] array, as used by pandas
+    """
+    return np.asarray(hours, dtype=np.int64).astype("datetime64[h]").astype("datetime64[ns]")
+
+
+def minutes_to_datetime(minutes: Iterable) -> np.ndarray:
+    """
+    Convert integer minute offsets back to timestamps, without any string parsing.
+
+    Args:
+        minutes: Integer minute offsets from the epoch
+
+    Returns:
+        datetime64[ns] array, as used by pandas
+    """
+    return np.asarray(minutes, dtype=np.int64).astype("datetime64[m]").astype("datetime64[ns]")
+
+
+def from_iso(values: Iterable[str]) -> np.ndarray:
+    """
+    Parse ISO 8601 strings (as returned by the Open-Meteo API) into hour offsets.
+
+    Args:
+        values: Strings such as "2024-01-01T13:00" or "2024-01-01"
+
+    Returns:
+        int64 array of hour offsets (floored to the hour)
+    """
+    return np.asarray(values, dtype="datetime64[m]").astype("datetime64[h]").astype(np.int64)
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """
+    Vectorized conversion of a proleptic Gregorian date to days since the epoch.
+
+    Args:
+        year: Years
+        month: Months (1-12)
+        day: Days of the month (1-31)
+
+    Returns:
+        int64 array of days since 1970-01-01
+    """
+    y = year - (month <= 2)
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * 146097 + doe - 719468
+
+
+def parse_scraped(values: Iterable[str]) -> np.ndarray:
+    """
+    Parse the "dd/mm/YYYY HH:MM" dates of the Defesa Civil table into minute offsets.
+
+    The strings are decoded as a matrix of code points and converted with integer
+    arithmetic, so no per-element datetime parsing takes place. This fast path only
+    accepts the zero-padded layout; callers should retry the NAT entries with a lenient
+    parser (see WebScraper.parse_data) before treating them as invalid.
+
+    Args:
+        values: Date strings in format dd/mm/YYYY HH:MM
+
+    Returns:
+        int64 array of minute offsets, NAT for strings that do not match the format or
+        that name a date that does not exist (e.g. 31/02)
+    """
+    strings = np.asarray(values, dtype=str)
+    n = len(strings)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    width = max(strings.dtype.itemsize // 4, 1)
+    codes = strings.view(np.uint32).reshape(n, width).astype(np.int64)
+    if width < _SCRAPED_WIDTH:
+        return np.full(n, NAT, dtype=np.int64)
+
+    valid = np.ones(n, dtype=bool)
+    if width > _SCRAPED_WIDTH:
+        valid &= codes[:, _SCRAPED_WIDTH] == 0
+    codes = codes[:, :_SCRAPED_WIDTH]
+
+    for position, separator in _SCRAPED_SEPARATORS.items():
+        valid &= codes[:, position] == ord(separator)
+    digit_positions = [i for i in range(_SCRAPED_WIDTH) if i not in _SCRAPED_SEPARATORS]
+    digits = codes[:, digit_positions] - ord("0")
+    valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+
+    day = digits[:, 0] * 10 + digits[:, 1]
+    month = digits[:, 2] * 10 + digits[:, 3]
+    year = digits[:, 4] * 1000 + digits[:, 5] * 100 + digits[:, 6] * 10 + digits[:, 7]
+    hour = digits[:, 8] * 10 + digits[:, 9]
+    minute = digits[:, 10] * 10 + digits[:, 11]
+
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_month = _DAYS_IN_MONTH[np.clip(month, 1, 12) - 1] + ((month == 2) & leap)
+    valid &= (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+    valid &= (hour <= 23) & (minute <= 59)
+
+    minutes = (_days_from_civil(year, month, day) * 24 + hour) * MINUTES_PER_HOUR + minute
+    minutes[~valid] = NAT
+    return minutes
+
+
+def _day_features(days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute day of week (Monday=0) and month for days since the epoch.
+
+    Args:
+        days: Days since 1970-01-01
+
+    Returns:
+        Tuple with the day of week and month arrays
+    """
+    # 1970-01-01 was a Thursday
+    day_of_week = ((days + 3) % 7).astype(np.int32)
+    month = (days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64) % 12 + 1).astype(np.int32)
+    return day_of_week, month
+
+
+@lru_cache(maxsize=1)
+def _calendar_table() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build (once per process) the day of week and month of every day in 1900-2099.
+
+    Returns:
+        Tuple with the read-only day of week and month tables, indexed by day
+    """
+    days = np.arange(_CALENDAR_FIRST_DAY, _CALENDAR_LAST_DAY, dtype=np.int64)
+    day_of_week, month = _day_features(days)
+    day_of_week.flags.writeable = False
+    month.flags.writeable = False
+    return day_of_week, month
+
+
+def calendar_features(hours: Iterable) -> Dict[str, np.ndarray]:
+    """
+    Look up the calendar features of hour offsets in the cached calendar table.
+
+    Args:
+        hours: Integer hour offsets from the epoch (no NAT values)
+
+    Returns:
+        Dict with "hour", "day_of_week" (Monday=0) and "month" int32 arrays
+    """
+    hours = np.asarray(hours, dtype=np.int64)
+    days = hours // 24
+    index = days - _CALENDAR_FIRST_DAY
+    in_table = (index >= 0) & (days < _CALENDAR_LAST_DAY)
+
+    table_dow, table_month = _calendar_table()
+    if in_table.all():
+        day_of_week = table_dow[index]
+        month = table_month[index]
+    else:
+        day_of_week, month = _day_features(days)
+        day_of_week[in_table] = table_dow[index[in_table]]
+        month[in_table] = table_month[index[in_table]]
+
+    return {
+        "hour": (hours % 24).astype(np.int32),
+        "day_of_week": day_of_week,
+        "month": month,
+    }
+
+
+def align(target: Iterable, source: Iterable, values: Iterable, tolerance: int) -> np.ndarray:
+    """
+    Place values on a target time index using the nearest source timestamp.
+
+    This is the single rule used to snap readings onto the hourly grid, equivalent to
+    pd.merge_asof(direction="nearest", tolerance=tolerance). Every target row gets its
+    own lookup, so repeated target timestamps are all filled. NaN values are aligned
+    like any other value (as merge_asof does), so readings blanked by the validator stay
+    NaN and are interpolated later; only NAT timestamps are ignored. Ties pick the
+    earlier source timestamp; repeated source timestamps keep their first value.
+
+    Args:
+        target: Integer offsets of the target index (e.g. the weather hours in minutes)
+        source: Integer offsets of the values to align, in the same unit as target
+        values: Values to align, same length as source
+        tolerance: Maximum distance between a target and its source, in the same unit
+
+    Returns:
+        float64 array aligned with target, NaN where no source lies within tolerance
+    """
+    target = np.asarray(target, dtype=np.int64)
+    source = np.asarray(source, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+
+    out = np.full(len(target), np.nan)
+    valid = source != NAT
+    if len(target) == 0 or not valid.any():
+        return out
+
+    source, first = np.unique(source[valid], return_index=True)
+    values = values[valid][first]
+
+    # Candidates are the source timestamps just before and just after each target
+    right = np.searchsorted(source, target)
+    left = np.maximum(right - 1, 0)
+    right = np.minimum(right, len(source) - 1)
+    left_distance = np.abs(target - source[left])
+    right_distance = np.abs(source[right] - target)
+    nearest = np.where(right_distance < left_distance, right, left)
+    distance = np.minimum(left_distance, right_distance)
+
+    matched = distance <= tolerance
+    out[matched] = values[nearest[matched]]
+    return out
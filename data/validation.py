@@ -0,0 +1,235 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Optional, Tuple
+from loguru import logger
+
+from .timeindex import MINUTES_PER_HOUR, to_minutes
+
+# Quality flags, combined bitwise into a compact uint8 mask (one byte per reading)
+FLAG_MISSING = 1        # Reading could not be parsed (NaN level)
+FLAG_DUPLICATE = 2      # Timestamp already seen; the first usable occurrence is kept
+FLAG_GAP = 4            # First reading after a gap in the series
+FLAG_OUT_OF_RANGE = 8   # Level outside the physically plausible range
+FLAG_SPIKE = 16         # Isolated jump that exceeds the maximum rate of change
+FLAG_STUCK = 32         # Part of a flat-line longer than the stuck window
+
+FLAG_NAMES = {
+    FLAG_MISSING: "missing",
+    FLAG_DUPLICATE: "duplicate",
+    FLAG_GAP: "gap",
+    FLAG_OUT_OF_RANGE: "out_of_range",
+    FLAG_SPIKE: "spike",
+    FLAG_STUCK: "stuck",
+}
+
+# Flags whose readings should not be used as water level values
+INVALID_FLAGS = FLAG_MISSING | FLAG_DUPLICATE | FLAG_OUT_OF_RANGE | FLAG_SPIKE | FLAG_STUCK
+
+
+class DataValidator:
+    """
+    A class that validates water level readings before they are merged with weather data.
+    Every check is vectorized over NumPy arrays so it can run on each refresh.
+    """
+
+    def __init__(
+        self,
+        min_level: float = 0.0,
+        max_level: float = 20.0,
+        max_rate: float = 1.0,
+        interval_hours: float = 1.0,
+        stuck_window: int = 24
+    ):
+        """
+        Initialize the DataValidator with the quality thresholds.
+
+        Args:
+            min_level: Minimum plausible water level in meters (default: 0.0)
+            max_level: Maximum plausible water level in meters (default: 20.0)
+            max_rate: Maximum plausible rate of change in meters per hour (default: 1.0)
+            interval_hours: Expected interval between readings in hours (default: 1.0)
+            stuck_window: Number of consecutive identical readings considered a stuck
+                          sensor (default: 24)
+        """
+        self.min_level = min_level
+        self.max_level = max_level
+        self.max_rate = max_rate
+        self.interval_hours = interval_hours
+        self.stuck_window = stuck_window
+
+    def detect(self, times: np.ndarray, levels: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Compute the quality mask for a series of readings.
+
+        Args:
+            times: Timestamps as integer minute offsets from the epoch (any order)
+            levels: Water levels, NaN for readings that could not be parsed
+
+        Returns:
+            Tuple with the uint8 quality mask (in the input order) and the report dict
+        """
+        n = len(times)
+        minutes = np.asarray(times, dtype=np.int64)
+        levels = np.asarray(levels, dtype=np.float64)
+
+        # Work on the series sorted by time; mergesort keeps duplicates in input order.
+        # Scraped data is usually sorted already, in which case the argsort is skipped
+        if n > 1 and not np.all(minutes[1:] >= minutes[:-1]):
+            order = np.argsort(minutes, kind="mergesort")
+            m = minutes[order]
+            v = levels[order]
+        else:
+            order = None
+            m = minutes
+            v = levels
+        flags = np.zeros(n, dtype=np.uint8)
+
+        flags[np.isnan(v)] |= FLAG_MISSING
+        flags[(v < self.min_level) | (v > self.max_level)] |= FLAG_OUT_OF_RANGE
+
+        dt_minutes = np.diff(m)
+        dt = dt_minutes / MINUTES_PER_HOUR
+        is_gap = dt > 1.5 * self.interval_hours
+        flags[1:][is_gap] |= FLAG_GAP
+
+        # For each repeated timestamp keep the first reading that is neither missing nor
+        # out of range (or the first one if none is), and flag the others as duplicates
+        if n > 1 and (dt_minutes == 0).any():
+            starts = np.flatnonzero(np.append(True, dt_minutes != 0))
+            unusable = (flags & (FLAG_MISSING | FLAG_OUT_OF_RANGE)) != 0
+            candidate = np.where(unusable, n, np.arange(n))
+            kept = np.minimum.reduceat(candidate, starts)
+            kept = np.where(kept == n, starts, kept)
+            duplicate = np.ones(n, dtype=bool)
+            duplicate[kept] = False
+            flags[duplicate] |= FLAG_DUPLICATE
+
+        # Rate of change and flat-lines are evaluated on the usable readings only
+        usable = np.flatnonzero((flags & (FLAG_MISSING | FLAG_DUPLICATE | FLAG_OUT_OF_RANGE)) == 0)
+        if len(usable) > 1:
+            uv = v[usable]
+            rate = np.diff(uv) / (np.diff(m[usable]) / MINUTES_PER_HOUR)
+            too_fast = np.abs(rate) > self.max_rate
+            # A spike jumps in and back out: both rates too fast and with opposite signs
+            spike = too_fast[:-1] & too_fast[1:] & (np.sign(rate[:-1]) != np.sign(rate[1:]))
+            flags[usable[1:-1][spike]] |= FLAG_SPIKE
+
+            # Run-length encode identical consecutive values and flag long runs (but
+            # keep the first reading of each run, which may be genuine)
+            change = np.empty(len(uv), dtype=bool)
+            change[0] = True
+            change[1:] = uv[1:] != uv[:-1]
+            starts = np.flatnonzero(change)
+            run_id = np.cumsum(change) - 1
+            run_len = np.diff(np.append(starts, len(uv)))
+            position = np.arange(len(uv)) - starts[run_id]
+            stuck = (run_len[run_id] >= self.stuck_window) & (position > 0)
+            flags[usable[stuck]] |= FLAG_STUCK
+
+        if order is None:
+            mask = flags
+        else:
+            mask = np.empty(n, dtype=np.uint8)
+            mask[order] = flags
+
+        gap_hours = dt[is_gap]
+        report = {
+            "rows": n,
+            "valid": int(np.count_nonzero((mask & INVALID_FLAGS) == 0)),
+            **{name: int(np.count_nonzero(mask & flag)) for flag, name in FLAG_NAMES.items()},
+            "missing_hours": int(np.round(gap_hours / self.interval_hours - 1).sum()),
+            "largest_gap_hours": float(gap_hours.max()) if len(gap_hours) else 0.0,
+        }
+        return mask, report
+
+    def validate(
+        self,
+        df: pd.DataFrame,
+        time_col: str = "Data",
+        level_col: str = "Nível"
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Compute the quality mask and report for a DataFrame of water level readings.
+
+        Args:
+            df: DataFrame with water level data (as returned by WebScraper.parse_data)
+            time_col: Name of the timestamp column (default: "Data")
+            level_col: Name of the water level column (default: "Nível")
+
+        Returns:
+            Tuple with the uint8 quality mask (aligned with df rows) and the report dict
+        """
+        return self.detect(
+            to_minutes(df[time_col].to_numpy()),
+            df[level_col].to_numpy(dtype=np.float64)
+        )
+
+    def clean(
+        self,
+        df: pd.DataFrame,
+        time_col: str = "Data",
+        level_col: str = "Nível",
+        mask: Optional[np.ndarray] = None
+    ) -> pd.DataFrame:
+        """
+        Drop duplicated timestamps and blank out invalid readings.
+
+        Flagged levels are set to NaN rather than removed, so the regular interpolation
+        in DataGenerator._process_data fills them from the neighbouring valid readings.
+
+        Args:
+            df: DataFrame with water level data
+            time_col: Name of the timestamp column (default: "Data")
+            level_col: Name of the water level column (default: "Nível")
+            mask: Precomputed quality mask (computed with validate() if not provided)
+
+        Returns:
+            Cleaned DataFrame sorted by time
+        """
+        if mask is None:
+            mask, _ = self.validate(df, time_col, level_col)
+
+        keep = (mask & FLAG_DUPLICATE) == 0
+        levels = df[level_col].to_numpy(dtype=np.float64, copy=True)
+        levels[(mask & INVALID_FLAGS) != 0] = np.nan
+
+        cleaned = df.assign(**{level_col: levels})[keep]
+        return cleaned.sort_values(time_col, kind="mergesort").reset_index(drop=True)
+
+    def log_report(self, report: Dict[str, Any]) -> None:
+        """
+        Log a compact summary of a quality report.
+
+        Args:
+            report: Report dict returned by detect() or validate()
+        """
+        issues = ", ".join(f"{name}={report[name]}" for name in FLAG_NAMES.values() if report[name])
+        logger.info(
+            f"Water level validation: {report['valid']}/{report['rows']} valid readings"
+            f" ({issues or 'no issues'}; {report['missing_hours']} missing hours)"
+        )
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+
+    # Synthetic hourly series with injected faults, to check the validation throughput
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    start = np.datetime64("2019-01-01T00:00", "m").astype(np.int64)
+    times = start + np.arange(n, dtype=np.int64) * MINUTES_PER_HOUR
+    levels = 3 + 2 * np.sin(np.arange(n) * 2 * np.pi / (24 * 30)) + rng.normal(0, 0.01, n)
+    levels[rng.integers(0, n, 1000)] += 5          # spikes
+    levels[rng.integers(0, n, 1000)] = np.nan      # unparsable readings
+    levels[100:200] = levels[100]                  # stuck sensor
+    dup = rng.integers(1, n, 1000)
+    times[dup] = times[dup - 1]                    # duplicated timestamps
+
+    validator = DataValidator()
+    start = time.perf_counter()
+    mask, report = validator.detect(times, levels)
+    elapsed = time.perf_counter() - start
+
+    print(f"Validated {n} rows in {elapsed:.3f}s")
+    print(report)